@@ -0,0 +1,491 @@
+#!/usr/bin/env python3
+"""
+Load Generator for the Scaling Labs
+===================================
+Drives an HTTP endpoint with asyncio over a pool of keep-alive connections
+and reports, in real time, how requests are spread across pods.
+
+The scaling labs (lab-46, lab-50) serve a page containing the hostname of the
+pod that answered, e.g. "Hello from Pod: my-app-7d9c-abcde".
+Instead of eyeballing a curl loop, this tool parses that hostname and prints:
+- per-pod request share
+- latency histogram and percentiles
+- error rate (connection errors, timeouts, non-2xx responses)
+
+Only the standard library is used, so it also runs from a plain
+python:3.x-slim pod inside the cluster.
+
+Usage:
+    # 10 connections, 30s
+    python load_generator.py http://localhost:8080/
+    # open loop, 200 req/s
+    python load_generator.py http://my-app-service/ --rate 200
+    # closed loop, 50 connections, 300s
+    python load_generator.py http://my-app-service/ -c 50 -d 300
+    python load_generator.py http://my-app-service/ --rate 50 --json report.json
+
+Note: a Kubernetes Service balances per *connection*, not per request. A
+keep-alive connection stays pinned to one pod, so use enough connections
+(--concurrency) and recycle them (--requests-per-connection) to pick up pods
+added by `kubectl scale` or the HPA.
+"""
+
+import sys
+import ssl
+import json
+import time
+import asyncio
+import argparse
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+# Matches the responses of the lab apps:
+#   lab-50: "Hello from Pod: <hostname>"
+#   lab-45 / lab-46: "Hello from <hostname>!"
+DEFAULT_POD_PATTERN = r'Hello from (?:Pod:\s*)?([A-Za-z0-9][A-Za-z0-9.\-_]*?)!?\s*$'
+
+# Upper bounds (ms) of the latency histogram buckets
+LATENCY_BUCKETS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000]
+
+UNKNOWN_POD = '<unknown>'
+
+# Pause after a connection error in closed-loop mode, so a pod that is
+# restarting is not hammered with reconnects
+CONNECT_RETRY_DELAY = 0.1
+
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description='Asyncio load generator reporting per-pod distribution'
+    )
+    parser.add_argument('url', help='Target URL (http:// or https://)')
+    parser.add_argument(
+        '-c', '--concurrency',
+        type=int,
+        default=10,
+        help='Number of pooled keep-alive connections (default: 10)'
+    )
+    parser.add_argument(
+        '-r', '--rate',
+        type=float,
+        default=0,
+        help='Target requests per second (open loop). 0 = as fast as the pool allows'
+    )
+    parser.add_argument(
+        '-d', '--duration',
+        type=float,
+        default=30,
+        help='Test duration in seconds (default: 30)'
+    )
+    parser.add_argument(
+        '-t', '--timeout',
+        type=float,
+        default=5,
+        help='Per-request timeout in seconds (default: 5)'
+    )
+    parser.add_argument(
+        '--requests-per-connection',
+        type=int,
+        default=100,
+        help='Reconnect after this many requests so new pods get traffic (0 = never)'
+    )
+    parser.add_argument(
+        '--interval',
+        type=float,
+        default=2,
+        help='Seconds between live reports (default: 2)'
+    )
+    parser.add_argument(
+        '--pod-pattern',
+        type=str,
+        default=DEFAULT_POD_PATTERN,
+        help='Regex with one group capturing the pod name from the response body'
+    )
+    parser.add_argument(
+        '--json',
+        type=str,
+        metavar='FILE',
+        help='Write the final report as JSON to FILE ("-" for stdout)'
+    )
+    return parser.parse_args()
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with approximate percentiles"""
+
+    def __init__(self, bounds_ms: List[float] = LATENCY_BUCKETS_MS):
+        self.bounds = list(bounds_ms)
+        self.counts = [0] * (len(self.bounds) + 1)  # last bucket is overflow
+        self.total = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, latency_ms: float):
+        for i, bound in enumerate(self.bounds):
+            if latency_ms <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.total += 1
+        self.sum_ms += latency_ms
+        self.max_ms = max(self.max_ms, latency_ms)
+
+    def percentile(self, pct: float) -> float:
+        """Return the upper bound of the bucket holding the given percentile"""
+        if not self.total:
+            return 0.0
+        threshold = self.total * pct / 100
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= threshold:
+                if i < len(self.bounds) and self.bounds[i] < self.max_ms:
+                    return self.bounds[i]
+                break
+        return round(self.max_ms, 2)
+
+    @property
+    def mean(self) -> float:
+        return self.sum_ms / self.total if self.total else 0.0
+
+    def to_dict(self) -> Dict:
+        labels = [f"<={b}ms" for b in self.bounds] + [f">{self.bounds[-1]}ms"]
+        return {
+            'buckets': dict(zip(labels, self.counts)),
+            'mean_ms': round(self.mean, 2),
+            'p50_ms': self.percentile(50),
+            'p90_ms': self.percentile(90),
+            'p99_ms': self.percentile(99),
+            'max_ms': round(self.max_ms, 2),
+        }
+
+
+class Stats:
+    """Aggregated results, plus a window that is reset after each live report"""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.pods: Counter = Counter()
+        self.errors: Counter = Counter()
+        self.latency = LatencyHistogram()
+        self.window_pods: Counter = Counter()
+        self.window_requests = 0
+        self.window_errors = 0
+        self.window_started = self.started
+        self.missed = 0  # scheduled sends still queued at the deadline
+
+    @property
+    def requests(self) -> int:
+        return sum(self.pods.values()) + sum(self.errors.values())
+
+    def record_ok(self, pod: str, latency_ms: float):
+        self.pods[pod] += 1
+        self.window_pods[pod] += 1
+        self.window_requests += 1
+        self.latency.record(latency_ms)
+
+    def record_error(self, kind: str):
+        self.errors[kind] += 1
+        self.window_requests += 1
+        self.window_errors += 1
+
+    def reset_window(self):
+        self.window_pods = Counter()
+        self.window_requests = 0
+        self.window_errors = 0
+        self.window_started = time.monotonic()
+
+    def to_dict(self) -> Dict:
+        elapsed = time.monotonic() - self.started
+        total = self.requests
+        ok = sum(self.pods.values())
+        return {
+            'elapsed_s': round(elapsed, 2),
+            'requests': total,
+            'rps': round(total / elapsed, 2) if elapsed else 0.0,
+            'error_rate': round(sum(self.errors.values()) / total, 4) if total else 0.0,
+            'errors': dict(self.errors),
+            'missed': self.missed,
+            'pods': {
+                pod: {'requests': count, 'share': round(count / ok, 4)}
+                for pod, count in self.pods.most_common()
+            },
+            'latency': self.latency.to_dict(),
+        }
+
+
+class HTTPConnection:
+    """Minimal HTTP/1.1 client connection, keeping the socket alive between requests"""
+
+    def __init__(self, url: str, timeout: float):
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https'):
+            raise ValueError(f"Unsupported URL scheme: {parts.scheme!r}")
+        self.host = parts.hostname or 'localhost'
+        self.port = parts.port or (443 if parts.scheme == 'https' else 80)
+        self.ssl = ssl.create_default_context() if parts.scheme == 'https' else None
+        self.path = (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+        host_header = parts.netloc.rsplit('@', 1)[-1]
+        self.request = (
+            f"GET {self.path} HTTP/1.1\r\n"
+            f"Host: {host_header}\r\n"
+            "User-Agent: devops-labs-loadgen/1.0\r\n"
+            "Accept: */*\r\n"
+            "Connection: keep-alive\r\n\r\n"
+        ).encode('ascii')
+        self.timeout = timeout
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.served = 0
+
+    async def _connect(self):
+        self.reader, self.writer = await asyncio.open_connection(
+            self.host, self.port, ssl=self.ssl
+        )
+        self.served = 0
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+    async def _read_body(self, headers: Dict[str, str]) -> bytes:
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int((await self.reader.readline()).split(b';', 1)[0], 16)
+                if size == 0:
+                    await self.reader.readline()  # trailing CRLF
+                    return b''.join(chunks)
+                chunks.append(await self.reader.readexactly(size))
+                await self.reader.readline()
+        if 'content-length' in headers:
+            return await self.reader.readexactly(int(headers['content-length']))
+        # No framing: body runs until the server closes the connection
+        body = await self.reader.read()
+        headers['connection'] = 'close'
+        return body
+
+    async def _get(self) -> Tuple[int, bytes]:
+        if self.writer is None:
+            await self._connect()
+        self.writer.write(self.request)
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionResetError('connection closed by peer')
+        version, status = status_line.split(None, 2)[:2]
+        headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        body = await self._read_body(headers)
+        self.served += 1
+        keep_alive = (
+            headers.get('connection', '').lower() != 'close'
+            and version == b'HTTP/1.1'
+        )
+        if not keep_alive:
+            self.close()
+        return int(status), body
+
+    async def get(self, max_requests: int) -> Tuple[int, bytes]:
+        """Send one GET request, reconnecting as needed"""
+        if max_requests and self.served >= max_requests:
+            self.close()
+        try:
+            return await asyncio.wait_for(self._get(), self.timeout)
+        except BaseException:
+            # The stream is in an unknown state, start over on the next request
+            self.close()
+            raise
+
+
+class LoadGenerator:
+    """Schedules requests over a connection pool and collects per-pod stats"""
+
+    def __init__(self, args):
+        self.args = args
+        self.pod_re = re.compile(args.pod_pattern, re.MULTILINE)
+        self.stats = Stats()
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    def _pod_name(self, body: bytes) -> str:
+        match = self.pod_re.search(body.decode('utf-8', 'replace'))
+        return match.group(1) if match else UNKNOWN_POD
+
+    async def _send(self, conn: HTTPConnection, scheduled: float):
+        """Send one request and record its outcome.
+
+        Returns False on connection errors.
+        """
+        try:
+            status, body = await conn.get(self.args.requests_per_connection)
+        except asyncio.TimeoutError:
+            self.stats.record_error('timeout')
+            return True
+        except (OSError, ValueError, asyncio.IncompleteReadError) as e:
+            self.stats.record_error(type(e).__name__)
+            return False
+
+        # Latency is measured from the scheduled send time, so a saturated
+        # pool shows up as latency instead of silently lowering the rate
+        latency_ms = (time.monotonic() - scheduled) * 1000
+        if 200 <= status < 300:
+            self.stats.record_ok(self._pod_name(body), latency_ms)
+        else:
+            self.stats.record_error(f"http_{status}")
+        return True
+
+    async def _worker(self, deadline: float):
+        conn = HTTPConnection(self.args.url, self.args.timeout)
+        try:
+            if self.args.rate:
+                while True:
+                    scheduled = await self.queue.get()
+                    if scheduled is None:
+                        return
+                    if time.monotonic() >= deadline:
+                        # A saturated pool falls behind the schedule, drain
+                        # the backlog instead of running past --duration
+                        self.stats.missed += 1
+                        continue
+                    await self._send(conn, scheduled)
+            else:
+                while time.monotonic() < deadline:
+                    if not await self._send(conn, time.monotonic()):
+                        await asyncio.sleep(CONNECT_RETRY_DELAY)
+        finally:
+            conn.close()
+
+    async def _scheduler(self, deadline: float):
+        """Open-loop producer: enqueue one timestamp every 1/rate seconds"""
+        interval = 1.0 / self.args.rate
+        next_send = time.monotonic()
+        while next_send < deadline:
+            now = time.monotonic()
+            if next_send > now:
+                await asyncio.sleep(next_send - now)
+            self.queue.put_nowait(next_send)
+            next_send += interval
+        for _ in range(self.args.concurrency):
+            self.queue.put_nowait(None)
+
+    async def _reporter(self):
+        while True:
+            await asyncio.sleep(self.args.interval)
+            self.print_window()
+
+    def print_window(self):
+        stats = self.stats
+        elapsed = time.monotonic() - stats.window_started
+        ok = sum(stats.window_pods.values())
+        rps = stats.window_requests / elapsed if elapsed else 0.0
+        err_pct = (
+            100 * stats.window_errors / stats.window_requests
+            if stats.window_requests else 0.0
+        )
+        print(
+            f"[{time.monotonic() - stats.started:6.1f}s] {rps:8.1f} req/s  "
+            f"errors {err_pct:5.1f}%  pods {len(stats.window_pods)}  "
+            f"p50 {stats.latency.percentile(50):g}ms  "
+            f"p99 {stats.latency.percentile(99):g}ms"
+        )
+        for pod, count in stats.window_pods.most_common():
+            share = count / ok
+            print(f"    {pod:<40} {share:6.1%} {'#' * int(share * 40)}")
+        stats.reset_window()
+
+    async def run(self) -> Dict:
+        deadline = time.monotonic() + self.args.duration
+        workers = [
+            asyncio.create_task(self._worker(deadline))
+            for _ in range(self.args.concurrency)
+        ]
+        tasks = list(workers)
+        if self.args.rate:
+            tasks.append(asyncio.create_task(self._scheduler(deadline)))
+        reporter = asyncio.create_task(self._reporter())
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            reporter.cancel()
+            for task in tasks:
+                task.cancel()
+        return self.stats.to_dict()
+
+
+def print_summary(report: Dict):
+    """Print the final report in a human readable form"""
+    print("\n" + "=" * 60)
+    print(f"Requests: {report['requests']} in {report['elapsed_s']}s "
+          f"({report['rps']} req/s)")
+    print(f"Error rate: {report['error_rate']:.2%} {report['errors'] or ''}")
+    if report['missed']:
+        print(f"Missed: {report['missed']} scheduled requests not sent "
+              "before the deadline")
+
+    print("\nPer-pod distribution:")
+    for pod, data in report['pods'].items():
+        print(f"  {pod:<40} {data['requests']:>8} {data['share']:7.1%}")
+    if report['pods']:
+        # From the raw counts, since a share rounds to 0.0 next to a busy pod.
+        counts = [d['requests'] for d in report['pods'].values()]
+        if min(counts):
+            print(f"  spread (max/min share): {max(counts) / min(counts):.2f}")
+        else:
+            print("  spread (max/min share): n/a")
+
+    latency = report['latency']
+    print("\nLatency:")
+    print(f"  mean {latency['mean_ms']}ms  p50 {latency['p50_ms']}ms  "
+          f"p90 {latency['p90_ms']}ms  p99 {latency['p99_ms']}ms  "
+          f"max {latency['max_ms']}ms")
+    total = sum(latency['buckets'].values()) or 1
+    for label, count in latency['buckets'].items():
+        if count:
+            print(f"  {label:>9} {count:>8} {'#' * int(40 * count / total)}")
+
+
+def main():
+    """Main entry point"""
+    args = parse_args()
+    if args.concurrency < 1:
+        print("❌ --concurrency must be at least 1")
+        return 1
+
+    mode = f"{args.rate:g} req/s" if args.rate else "max throughput"
+    print(f"Load testing {args.url} for {args.duration:g}s "
+          f"({mode}, {args.concurrency} connections)")
+
+    generator = LoadGenerator(args)
+    try:
+        report = asyncio.run(generator.run())
+    except KeyboardInterrupt:
+        report = generator.stats.to_dict()
+
+    # The report is written first, so that it isn't lost if printing fails.
+    if args.json and args.json != '-':
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+    print_summary(report)
+    if args.json == '-':
+        print(json.dumps(report, indent=2))
+    elif args.json:
+        print(f"\n✅ Report written to {args.json}")
+
+    return 0 if report['requests'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,12 +8,21 @@ Fetches trending DevOps topics from multiple sources:
 - CNCF Blog
 - Reddit r/devops, r/kubernetes
 - Hacker News (filtered for DevOps)
+
+Hacker News items are cached on disk between runs (see HNItemCache), so a
+scrape only fetches the stories that entered the top list since the last one.
 """
 
+import os
+import json
+import time
 import random
+import tempfile
 import requests
 import feedparser
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 from tenacity import retry, stop_after_attempt, wait_exponential
@@ -41,6 +50,26 @@ TECH_KEYWORDS = {
 }
 
 
+HN_API_URL = "https://hacker-news.firebaseio.com/v0"
+
+# How many of the top stories to scan (topstories.json returns up to 500)
+HN_DEFAULT_DEPTH = 50
+HN_MAX_DEPTH = 500
+
+# Bound on concurrent item requests to the HN API
+HN_DEFAULT_WORKERS = 16
+
+# Cached matching stories are refetched after this many seconds so that their
+# score stays current; titles don't change, so other items are never refetched
+HN_DEFAULT_CACHE_TTL = 15 * 60
+
+HN_DEFAULT_CACHE_PATH = os.path.join(
+    os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')),
+    'devops-lab-generator',
+    'hn_items.json',
+)
+
+
 def detect_technology(text: str) -> Optional[str]:
     """Detect which DevOps technology is mentioned in the text"""
     text_lower = text.lower()
@@ -56,19 +85,106 @@ def detect_technology(text: str) -> Optional[str]:
     return None
 
 
+def is_devops_related(text: str) -> bool:
+    """Check whether the text mentions any DevOps keyword"""
+    text_lower = text.lower()
+    return any(kw in text_lower for kws in TECH_KEYWORDS.values() for kw in kws)
+
+
+class HNItemCache:
+    """Persistent cache of Hacker News items, keyed by story id
+
+    Only the fields the scraper uses are kept, along with the time they were
+    fetched. The cache is a JSON file, rewritten atomically by save().
+    """
+
+    def __init__(self, path: str, ttl: float):
+        self.path = path
+        self.ttl = ttl
+        self.items: Dict[str, Dict] = {}
+        try:
+            with open(path) as f:
+                items = json.load(f)
+            if isinstance(items, dict):
+                self.items = items
+        except (OSError, ValueError):
+            pass
+
+    def get(self, story_id: int) -> Optional[Dict]:
+        """Return the cached item, or None if it must be fetched"""
+        item = self.items.get(str(story_id))
+        if item is None:
+            return None
+        # Only matching stories are shown, with their score, so only they go
+        # stale; the title of every other item has already been checked
+        if item.get('relevant') and time.time() - item['fetched'] > self.ttl:
+            return None
+        return item
+
+    def put(self, story_id: int, story: Optional[Dict]) -> Dict:
+        """Cache the fields of a fetched item and return them"""
+        story = story or {}
+        title = story.get('title', '')
+        item = {
+            'fetched': time.time(),
+            'title': title,
+            'url': story.get('url'),
+            'score': story.get('score', 0),
+            'relevant': story.get('type') == 'story' and is_devops_related(title),
+        }
+        self.items[str(story_id)] = item
+        return item
+
+    def prune(self, story_ids: List[int]):
+        """Drop the items that are no longer listed"""
+        keep = {str(story_id) for story_id in story_ids}
+        self.items = {k: v for k, v in self.items.items() if k in keep}
+
+    def save(self):
+        try:
+            directory = os.path.dirname(self.path) or '.'
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self.items, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠️ Could not save Hacker News cache: {e}")
+
+
 class DevOpsScraper:
     """Main scraper class that aggregates content from multiple sources"""
 
-    def __init__(self):
+    def __init__(self, hn_depth: Optional[int] = None, hn_workers: Optional[int] = None,
+                 hn_cache_path: Optional[str] = None, hn_cache_ttl: Optional[float] = None):
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (compatible; DevOpsLabBot/1.0; +https://github.com/Sid-Romero/docker-mastery-labs)'
         }
         self.topics: List[DevOpsTopic] = []
 
+        # Hacker News settings, overridable from the environment
+        if hn_depth is None:
+            hn_depth = int(os.environ.get('HN_DEPTH', HN_DEFAULT_DEPTH))
+        self.hn_depth = max(1, min(hn_depth, HN_MAX_DEPTH))
+        if hn_workers is None:
+            hn_workers = int(os.environ.get('HN_WORKERS', HN_DEFAULT_WORKERS))
+        self.hn_workers = max(1, hn_workers)
+        self.hn_cache_path = (hn_cache_path or os.environ.get('HN_CACHE_PATH')
+                              or HN_DEFAULT_CACHE_PATH)
+        if hn_cache_ttl is None:
+            hn_cache_ttl = float(os.environ.get('HN_CACHE_TTL', HN_DEFAULT_CACHE_TTL))
+        self.hn_cache_ttl = hn_cache_ttl
+
+        # Keep-alive connections, shared by the concurrent HN item requests
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_maxsize=self.hn_workers)
+        self.session.mount('https://', adapter)
+
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
     def _fetch_url(self, url: str) -> requests.Response:
         """Fetch URL with retry logic"""
-        response = requests.get(url, headers=self.headers, timeout=15)
+        response = self.session.get(url, timeout=15)
         response.raise_for_status()
         return response
 
@@ -211,40 +327,57 @@ class DevOpsScraper:
 
         return topics
 
+    def _fetch_hn_item(self, story_id: int) -> Optional[Dict]:
+        """Fetch one HN item, or None if it could not be fetched"""
+        try:
+            return self._fetch_url(f"{HN_API_URL}/item/{story_id}.json").json()
+        except Exception:
+            return None
+
     def scrape_hackernews(self) -> List[DevOpsTopic]:
-        """Scrape Hacker News for DevOps-related posts"""
+        """Scrape Hacker News for DevOps-related posts
+
+        Items are taken from the on-disk cache when possible; the others are
+        fetched concurrently, at most hn_workers at a time.
+        """
         topics = []
         try:
             # Get top stories
-            url = "https://hacker-news.firebaseio.com/v0/topstories.json"
-            response = self._fetch_url(url)
-            story_ids = response.json()[:50]  # Top 50
+            response = self._fetch_url(f"{HN_API_URL}/topstories.json")
+            all_story_ids = response.json()
+            story_ids = all_story_ids[:self.hn_depth]
+
+            cache = HNItemCache(self.hn_cache_path, self.hn_cache_ttl)
+            items = {story_id: cache.get(story_id) for story_id in story_ids}
+            missing = [story_id for story_id, item in items.items() if item is None]
+            if missing:
+                workers = min(self.hn_workers, len(missing))
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    stories = pool.map(self._fetch_hn_item, missing)
+                    for story_id, story in zip(missing, stories):
+                        # Failed fetches are retried on the next run
+                        if story is not None:
+                            items[story_id] = cache.put(story_id, story)
+            print(f"    {len(story_ids) - len(missing)} cached, {len(missing)} fetched")
+
+            cache.prune(all_story_ids)
+            cache.save()
 
             for story_id in story_ids:
-                try:
-                    story_url = f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json"
-                    story_response = self._fetch_url(story_url)
-                    story = story_response.json()
-
-                    if not story or story.get('type') != 'story':
-                        continue
-
-                    title = story.get('title', '')
-                    url = story.get('url', f"https://news.ycombinator.com/item?id={story_id}")
-
-                    # Check if DevOps-related
-                    if any(kw in title.lower() for kws in TECH_KEYWORDS.values() for kw in kws):
-                        tech = detect_technology(title)
-                        topics.append(DevOpsTopic(
-                            title=title,
-                            summary=f"Hacker News discussion with {story.get('score', 0)} points",
-                            source='hackernews',
-                            url=url,
-                            tags=['hackernews'],
-                            technology=tech
-                        ))
-                except Exception:
+                item = items[story_id]
+                if not item or not item.get('relevant'):
                     continue
+
+                title = item['title']
+                tech = detect_technology(title)
+                topics.append(DevOpsTopic(
+                    title=title,
+                    summary=f"Hacker News discussion with {item.get('score', 0)} points",
+                    source='hackernews',
+                    url=item.get('url') or f"https://news.ycombinator.com/item?id={story_id}",
+                    tags=['hackernews'],
+                    technology=tech
+                ))
         except Exception as e:
             print(f"⚠️ Error scraping Hacker News: {e}")
 